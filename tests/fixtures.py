@@ -4,19 +4,32 @@ from decimal import Decimal
 import operator
 import re
 
-import pytest
-import pydash
-
 import verify as v
 from verify import Not
 
 
+_DEC_1_05 = Decimal('1.05')
+_RE_WORD = re.compile(r'\w+')
+_DATE = datetime.date(2015, 1, 1)
+_DATETIME = datetime.datetime(2015, 1, 1, 1, 0, 59)
+
+
 class Arg(object):
+    __slots__ = ('args', 'kargs', 'label')
+
     def __init__(self, *args, **kargs):
         self.args = args
         self.kargs = kargs
+        self.label = None
+
+    def labeled(self, label):
+        """Return self with `label` used as its parameter id."""
+        self.label = label
+        return self
 
     def __repr__(self):
+        if self.label is not None:
+            return self.label
         return '{0}-{1}'.format(self.args, self.kargs)
     __str__ = __repr__
 
@@ -25,34 +38,58 @@ def assert_truthy(value):
     assert value
 
 
+def identity(value):
+    return value
+
+
+def is_boolean(value):
+    return isinstance(value, bool)
+
+
+def is_number(value):
+    return isinstance(value, (int, float, Decimal)) and not is_boolean(value)
+
+
+def is_integer(value):
+    return isinstance(value, int) and not is_boolean(value)
+
+
+def is_not_number(value):
+    return not is_number(value)
+
+
+def is_none(value):
+    return value is None
+
+
 def make_parametrize_id(argvalue):
     """Return custom parameter id for test reporting."""
+    name = getattr(argvalue, '__name__', None)
+
     if isinstance(argvalue, Arg):
         return str(argvalue)
-    elif hasattr(argvalue, '__name__'):
-        return '-' + argvalue.__name__
+    elif name is not None:
+        return '-' + name
     else:
         return str(argvalue)
 
 
-def raises_assertion():
-    """Expect AssertionError to be raised."""
-    return pytest.raises(AssertionError)
-
-
-METHOD_CALL_CASES = [
+METHOD_CALL_CASES = (
     (v.Not, False, Arg(v.Truthy)),
     (v.Not, True, Arg(v.Falsy)),
-    (v.Not, 1, Arg(pydash.is_boolean)),
-    (v.Predicate, True, Arg(pydash.is_boolean)),
-    (v.Predicate, 1, Arg(pydash.is_number)),
+    (v.Not, 1, Arg(is_boolean)),
+    (v.Not, 1, Arg(v.Equal(2))),
+    (v.Not, 5, Arg(v.Between(min=6))),
+    (v.Predicate, True, Arg(is_boolean)),
+    (v.Predicate, 1, Arg(is_number)),
     (v.Equal, 1, Arg(1)),
     (v.Equal, True, Arg(True)),
     (v.Equal, 1, Arg(True)),
     (v.Equal, 0, Arg(False)),
     (v.Equal, 'abc', Arg('abc')),
     (v.Match, 'abc', Arg(r'\w+')),
-    (v.Match, 'abc', Arg(re.compile(r'\w+'))),
+    (v.Match, 'abc', Arg(_RE_WORD)),
+    (v.Match, 'ABC', Arg(r'[a-z]+', flags=re.I)),
     (v.Greater, 5, Arg(4)),
     (v.Greater, 10, Arg(-10)),
     (v.Greater, 'b', Arg('a')),
@@ -86,8 +123,9 @@ METHOD_CALL_CASES = [
     (v.IsTrue, True, Arg()),
     (v.IsFalse, False, Arg()),
     (v.IsNone, None, Arg()),
-    (v.All, True, Arg([pydash.is_boolean, pydash.is_nan])),
-    (v.Any, True, Arg([pydash.is_boolean, pydash.is_number])),
+    (v.All, True, Arg([is_boolean, is_not_number])),
+    (v.Any, True, Arg([is_boolean, is_number])),
+    (v.Any, None, Arg([v.Truthy, is_none])),
     (v.In, 1, Arg([0, 1, 2])),
     (v.In, 'a', Arg(('a', 'b', 'c'))),
     (v.In, 'a', Arg('abc')),
@@ -95,18 +133,23 @@ METHOD_CALL_CASES = [
     (v.Contains, {'one': 1, 'two': 2}, Arg('two')),
     (v.ContainsOnly, [1, 1, 1], Arg([1])),
     (v.ContainsOnly, [1, 0, 1], Arg((1, 0))),
+    (v.ContainsOnly, [[1], [2]], Arg([[1], [2], [3]])),
+    (v.ContainsOnly, 'abba', Arg('ab')),
+    (v.ContainsOnly, [1, 0, 1], Arg(set([0, 1]))),
     (v.Subset, {'b': 2}, Arg({'a': 1, 'b': 2})),
     (v.Subset,
      {'a': [{'b': [{'d': 4}]}]},
-     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]})),
+     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]}).labeled('nested')),
     (v.Subset, [1, 2], Arg([1, 2, 3])),
     (v.Superset, {'a': 1, 'b': 2}, Arg({'b': 2})),
     (v.Superset,
      {'a': [{'b': [{'c': 3, 'd': 4}]}]},
-     Arg({'a': [{'b': [{'d': 4}]}]})),
+     Arg({'a': [{'b': [{'d': 4}]}]}).labeled('nested')),
     (v.Superset, [1, 2, 3], Arg([1, 2])),
     (v.Unique, [1, 2, 3, 4], Arg()),
     (v.Unique, {'one': 1, 'two': 2, 'thr': 3}, Arg()),
+    (v.Unique, [[1], [2], {'a': 1}], Arg()),
+    (v.Unique, [1, [1], (1,), {'a': 1}, 'a'], Arg()),
     (v.Type, True, Arg(bool)),
     (v.Type, 'abc', Arg(str)),
     (v.Type, 1, Arg(int)),
@@ -123,8 +166,8 @@ METHOD_CALL_CASES = [
     (v.Dict, {}, Arg()),
     (v.List, [], Arg()),
     (v.Tuple, (), Arg()),
-    (v.Date, datetime.date.today(), Arg()),
-    (v.Date, datetime.datetime.now(), Arg()),
+    (v.Date, _DATE, Arg()),
+    (v.Date, _DATETIME, Arg()),
     (v.DateString, '2015-01-01', Arg('%Y-%m-%d')),
     (v.DateString, '2015-01-01T01:00:59', Arg('%Y-%m-%dT%H:%M:%S')),
     (v.Int, 1, Arg()),
@@ -133,15 +176,18 @@ METHOD_CALL_CASES = [
     (v.Number, 0, Arg()),
     (v.Number, -1, Arg()),
     (v.Number, 1.05, Arg()),
-    (v.Number, Decimal('1.05'), Arg()),
+    (v.Number, _DEC_1_05, Arg()),
     (v.Positive, 1, Arg()),
     (v.Positive, 100, Arg()),
     (v.Negative, -1, Arg()),
     (v.Negative, -100, Arg()),
     (v.Even, 2, Arg()),
     (v.Even, -8, Arg()),
+    (v.Even, 4.0, Arg()),
     (v.Odd, 1, Arg()),
     (v.Odd, -5, Arg()),
+    (v.Odd, 3.0, Arg()),
+    (v.Odd, Decimal('-3'), Arg()),
     (v.Monotone, [1, 1, 3, 5], Arg(operator.le)),
     (v.Monotone, [1, 2, 10, 20], Arg(operator.lt)),
     (v.Increasing, [1, 1, 3, 5], Arg()),
@@ -152,7 +198,7 @@ METHOD_CALL_CASES = [
     (v.NotEqual, True, Arg(False)),
     (v.NotEqual, 'abc', Arg('cba')),
     (v.NotMatch, '###', Arg(r'\w+')),
-    (v.NotMatch, '###', Arg(re.compile(r'\w+'))),
+    (v.NotMatch, '###', Arg(_RE_WORD)),
     (v.NotMatch, 1, Arg(r'\w+')),
     (v.NotBetween, 5, Arg(max=4)),
     (v.NotBetween, 5, Arg(min=1, max=4)),
@@ -172,8 +218,9 @@ METHOD_CALL_CASES = [
     (v.IsNotNone, True, Arg()),
     (v.IsNotNone, 1, Arg()),
     (v.IsNotNone, 'verify', Arg()),
-    (v.NotAll, True, Arg([pydash.is_boolean, pydash.is_number])),
-    (v.NotAny, True, Arg([pydash.is_none, pydash.is_number])),
+    (v.NotAll, True, Arg([is_boolean, is_number])),
+    (v.NotAny, True, Arg([is_none, is_number])),
+    (v.NotAny, 0, Arg([v.Truthy, is_none])),
     (v.NotIn, 1, Arg([0, 0, 2])),
     (v.NotIn, 'a', Arg(('b', 'b', 'c'))),
     (v.NotIn, 1, Arg(2)),
@@ -185,12 +232,12 @@ METHOD_CALL_CASES = [
     (v.NotSubset, {'a': 1, 'b': 2}, Arg({'b': 2})),
     (v.NotSubset,
      {'a': [{'b': [{'c': 3, 'd': 4}]}]},
-     Arg({'a': [{'b': [{'d': 4}]}]})),
+     Arg({'a': [{'b': [{'d': 4}]}]}).labeled('nested')),
     (v.NotSubset, [1, 2, 3], Arg([1, 2])),
     (v.NotSuperset, {'b': 2}, Arg({'a': 1, 'b': 2})),
     (v.NotSuperset,
      {'a': [{'b': [{'d': 4}]}]},
-     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]})),
+     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]}).labeled('nested')),
     (v.NotSuperset, [1, 2], Arg([1, 2, 3])),
     (v.NotUnique, [1, 1, 2], Arg()),
     (v.NotUnique, {'one': 1, 'uno': 1}, Arg()),
@@ -224,22 +271,24 @@ METHOD_CALL_CASES = [
     (v.NotNumber, '', Arg()),
     (v.NotNumber, True, Arg()),
     (v.NotNumber, {}, Arg()),
-]
+)
 
 
-METHOD_RAISE_CASES = [
+METHOD_RAISE_CASES = (
     (v.Not, True, Arg(v.Truthy)),
     (v.Not, False, Arg(v.Falsy)),
-    (v.Not, True, Arg(pydash.is_boolean)),
-    (v.Predicate, 1, Arg(pydash.is_boolean)),
-    (v.Predicate, True, Arg(pydash.is_number)),
+    (v.Not, True, Arg(is_boolean)),
+    (v.Not, 1, Arg(v.Equal(1))),
+    (v.Predicate, 1, Arg(is_boolean)),
+    (v.Predicate, True, Arg(is_number)),
     (v.Predicate, False, Arg(assert_truthy)),
     (v.Equal, 1, Arg(2)),
     (v.Equal, True, Arg(False)),
     (v.Equal, 'abc', Arg('cba')),
     (v.Match, '###', Arg(r'\w+')),
-    (v.Match, '###', Arg(re.compile(r'\w+'))),
+    (v.Match, '###', Arg(_RE_WORD)),
     (v.Match, 1, Arg(r'\w+')),
+    (v.Match, 'ABC', Arg(r'[a-z]+')),
     (v.Greater, 5, Arg(5)),
     (v.Greater, 4, Arg(5)),
     (v.Greater, 'a', Arg('b')),
@@ -274,8 +323,10 @@ METHOD_RAISE_CASES = [
     (v.IsNone, True, Arg()),
     (v.IsNone, 1, Arg()),
     (v.IsNone, 'verify', Arg()),
-    (v.All, True, Arg([pydash.is_boolean, pydash.is_number])),
-    (v.Any, True, Arg([pydash.is_none, pydash.is_number])),
+    (v.All, True, Arg([is_boolean, is_number])),
+    (v.Any, True, Arg([is_none, is_number])),
+    (v.All, 1, Arg([is_number, v.Falsy])),
+    (v.Any, 0, Arg([v.Truthy, is_none])),
     (v.In, 1, Arg([0, 0, 2])),
     (v.In, 'a', Arg(('b', 'b', 'c'))),
     (v.In, 1, Arg(2)),
@@ -284,18 +335,25 @@ METHOD_RAISE_CASES = [
     (v.Contains, 4, Arg(4)),
     (v.ContainsOnly, 1, Arg(1)),
     (v.ContainsOnly, [1, 0], Arg([1])),
+    (v.ContainsOnly, [[1], [4]], Arg([[1], [2], [3]])),
+    (v.ContainsOnly, [1, [0]], Arg(frozenset([0, 1]))),
     (v.Subset, {'a': 1, 'b': 2}, Arg({'b': 2})),
     (v.Subset,
      {'a': [{'b': [{'c': 3, 'd': 4}]}]},
-     Arg({'a': [{'b': [{'d': 4}]}]})),
+     Arg({'a': [{'b': [{'d': 4}]}]}).labeled('nested')),
     (v.Subset, [1, 2, 3], Arg([1, 2])),
     (v.Superset, {'b': 2}, Arg({'a': 1, 'b': 2})),
     (v.Superset,
      {'a': [{'b': [{'d': 4}]}]},
-     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]})),
+     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]}).labeled('nested')),
     (v.Superset, [1, 2], Arg([1, 2, 3])),
     (v.Unique, [1, 1, 2], Arg()),
     (v.Unique, {'one': 1, 'uno': 1}, Arg()),
+    (v.Unique, [[1], [2], [1]], Arg()),
+    (v.Unique, [1, [2], 3, [2]], Arg()),
+    (v.Unique, [[1], 2, 2], Arg()),
+    (v.Unique, [frozenset([1]), set([1])], Arg()),
+    (v.Unique, [set([1]), frozenset([1])], Arg()),
     (v.Type, True, Arg(str)),
     (v.Type, 'abc', Arg(int)),
     (v.Type, 1, Arg(str)),
@@ -339,10 +397,13 @@ METHOD_RAISE_CASES = [
     (v.Positive, -100, Arg()),
     (v.Negative, 1, Arg()),
     (v.Negative, 100, Arg()),
+    (v.Negative, '-1', Arg()),
     (v.Even, 1, Arg()),
     (v.Even, -5, Arg()),
+    (v.Even, False, Arg()),
     (v.Odd, 2, Arg()),
     (v.Odd, -8, Arg()),
+    (v.Odd, True, Arg()),
     (v.Monotone, [1, 0, 3, 5], Arg(operator.le)),
     (v.Monotone, [1, 2, 0, 20], Arg(operator.lt)),
     (v.Increasing, [1, 0, 3, 5], Arg()),
@@ -355,7 +416,7 @@ METHOD_RAISE_CASES = [
     (v.NotEqual, 0, Arg(False)),
     (v.NotEqual, 'abc', Arg('abc')),
     (v.NotMatch, 'abc', Arg(r'\w+')),
-    (v.NotMatch, 'abc', Arg(re.compile(r'\w+'))),
+    (v.NotMatch, 'abc', Arg(_RE_WORD)),
     (v.NotBetween, 5, Arg(min=4, max=5)),
     (v.NotBetween, 5, Arg(max=5)),
     (v.NotBetween, 5, Arg(min=5)),
@@ -374,8 +435,8 @@ METHOD_RAISE_CASES = [
     (v.IsNotTrue, True, Arg()),
     (v.IsNotFalse, False, Arg()),
     (v.IsNotNone, None, Arg()),
-    (v.NotAll, True, Arg([pydash.is_boolean, pydash.is_nan])),
-    (v.NotAny, True, Arg([pydash.is_boolean, pydash.is_number])),
+    (v.NotAll, True, Arg([is_boolean, is_not_number])),
+    (v.NotAny, True, Arg([is_boolean, is_number])),
     (v.NotIn, 1, Arg([0, 1, 2])),
     (v.NotIn, 'a', Arg(('a', 'b', 'c'))),
     (v.NotIn, 'a', Arg('abc')),
@@ -386,12 +447,12 @@ METHOD_RAISE_CASES = [
     (v.NotSubset, {'b': 2}, Arg({'a': 1, 'b': 2})),
     (v.NotSubset,
      {'a': [{'b': [{'d': 4}]}]},
-     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]})),
+     Arg({'a': [{'b': [{'c': 3, 'd': 4}]}]}).labeled('nested')),
     (v.NotSubset, [1, 2], Arg([1, 2, 3])),
     (v.NotSuperset, {'a': 1, 'b': 2}, Arg({'b': 2})),
     (v.NotSuperset,
      {'a': [{'b': [{'c': 3, 'd': 4}]}]},
-     Arg({'a': [{'b': [{'d': 4}]}]})),
+     Arg({'a': [{'b': [{'d': 4}]}]}).labeled('nested')),
     (v.NotSuperset, [1, 2, 3], Arg([1, 2])),
     (v.NotUnique, [1, 2, 3, 4], Arg()),
     (v.NotUnique, {'one': 1, 'two': 2, 'thr': 3}, Arg()),
@@ -404,8 +465,8 @@ METHOD_RAISE_CASES = [
     (v.NotDict, {}, Arg()),
     (v.NotList, [], Arg()),
     (v.NotTuple, (), Arg()),
-    (v.NotDate, datetime.date.today(), Arg()),
-    (v.NotDate, datetime.datetime.now(), Arg()),
+    (v.NotDate, _DATE, Arg()),
+    (v.NotDate, _DATETIME, Arg()),
     (v.NotDateString, '2015-01-01', Arg('%Y-%m-%d')),
     (v.NotDateString, '2015-01-01T01:00:59', Arg('%Y-%m-%dT%H:%M:%S')),
     (v.NotInt, 1, Arg()),
@@ -414,11 +475,11 @@ METHOD_RAISE_CASES = [
     (v.NotNumber, 0, Arg()),
     (v.NotNumber, -1, Arg()),
     (v.NotNumber, 1.05, Arg()),
-    (v.NotNumber, Decimal('1.05'), Arg()),
-]
+    (v.NotNumber, _DEC_1_05, Arg()),
+)
 
 
-METHOD_ALIAS_CASES = [
+METHOD_ALIAS_CASES = (
     (v.expect, v.ensure),
     (v.Greater, v.GreaterThan),
     (v.GreaterEqual, v.GreaterOrEqual),
@@ -585,4 +646,4 @@ METHOD_ALIAS_CASES = [
     (v.Number, v.is_number),
     (v.NotNumber, v.to_not_be_number),
     (v.NotNumber, v.is_not_number),
-]
+)
@@ -1,17 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+
 import pytest
-import pydash
 
 import verify as v
 from verify import expect, ensure
 
 from .fixtures import (
+    Arg,
     METHOD_CALL_CASES,
     METHOD_RAISE_CASES,
     METHOD_ALIAS_CASES,
-    raises_assertion,
     assert_truthy,
+    identity,
+    is_boolean,
+    is_integer,
+    is_number,
     make_parametrize_id
 )
 
@@ -25,7 +30,7 @@ def test_expect_multiple_assertions(value, assertions):
 
 
 @pytest.mark.parametrize('value,predicates', [
-    (True, (pydash.is_boolean, pydash.identity)),
+    (True, (is_boolean, identity)),
 ])
 def test_expect_predicates(value, predicates):
     """Test that Expect handles multiple predicates that returns boolean
@@ -35,14 +40,14 @@ def test_expect_predicates(value, predicates):
 
 
 @pytest.mark.parametrize('value,predicates', [
-    (True, (pydash.is_boolean, pydash.is_number)),
-    (True, (pydash.is_integer, pydash.identity)),
+    (True, (is_boolean, is_number)),
+    (True, (is_integer, identity)),
 ])
 def test_expect_predicates_raises(value, predicates):
     """Test that Expect handles multiple predicates that returns boolean
     values.
     """
-    with raises_assertion():
+    with pytest.raises(AssertionError):
         assert expect(value, *predicates)
 
 
@@ -55,10 +60,15 @@ def test_expect_chaining():
     assert expect(True, v.Boolean(), assert_truthy).Truthy()
 
 
+CHAIN_METHODS = tuple(method for method in dir(v)
+                      if method[0].isupper() or method[:2] in ('to', 'is'))
+
+
 def test_expect_chain_method_proxy():
-    for method in [method for method in dir(v)
-                   if method[0].isupper() or method[:2] in ('to', 'is')]:
-        assert getattr(v, method) is getattr(expect(None), method).assertion
+    chain = expect(None)
+
+    for method in CHAIN_METHODS:
+        assert getattr(v, method) is getattr(chain, method).assertion
 
 
 @pytest.mark.parametrize('method', [
@@ -70,34 +80,66 @@ def test_expect_chain_invalid_method(method):
         getattr(expect(None), method)
 
 
+@pytest.mark.parametrize('mode', ['expect', 'direct'])
 @pytest.mark.parametrize('meth,value,arg',
                          METHOD_CALL_CASES,
                          ids=make_parametrize_id)
-def test_assert_method(meth, value, arg):
+def test_assert_method(meth, value, arg, mode):
     """Test that method passes when evaluated for comparables."""
-    assert expect(value, meth(*arg.args, **arg.kargs))
-    assert meth(value, *arg.args, **arg.kargs)
+    if mode == 'expect':
+        assert expect(value, meth(*arg.args, **arg.kargs))
+    else:
+        assert meth(value, *arg.args, **arg.kargs)
 
 
+@pytest.mark.parametrize('mode', ['expect', 'direct', 'msg'])
 @pytest.mark.parametrize('meth,value,arg',
                          METHOD_RAISE_CASES,
                          ids=make_parametrize_id)
-def test_assert_raises(meth, value, arg):
+def test_assert_raises(meth, value, arg, mode):
     """Test that method raises an assertion error when evaluated for
     comparables.
     """
-    with raises_assertion() as exc:
-        expect(value, meth(*arg.args, **arg.kargs))
+    if mode == 'expect':
+        with pytest.raises(AssertionError):
+            expect(value, meth(*arg.args, **arg.kargs))
+    elif mode == 'direct':
+        with pytest.raises(AssertionError):
+            meth(value, *arg.args, **arg.kargs)
+    else:
+        opts = arg.kargs.copy()
+        opts.update({'msg': 'TEST CUSTOM MESSAGE'})
+
+        with pytest.raises(AssertionError) as exc:
+            meth(value, *arg.args, **opts)
+
+        assert opts['msg'] in str(exc.value)
 
-    with raises_assertion() as exc:
+
+@pytest.mark.parametrize('meth,value,arg,expected', [
+    (v.Equal, 1, Arg(2), '1 is not equal to 2'),
+    (v.Between, 5, Arg(min=6, max=7), '5 is not between 6 and 7'),
+    (v.Length, [1], Arg(max=0), '[1] does not have length between None and 0'),
+    (v.Match, 'abc', Arg('z'),
+     'abc does not match the regular expression z'),
+])
+def test_assert_default_message(meth, value, arg, expected):
+    """Test that default assert messages are formatted with the assertion's
+    options.
+    """
+    with pytest.raises(AssertionError) as exc:
         meth(value, *arg.args, **arg.kargs)
 
-    with raises_assertion() as exc:
-        opts = arg.kargs.copy()
-        opts.update({'msg': 'TEST CUSTOM MESSAGE'})
-        meth(value, *arg.args, **opts)
+    assert str(exc.value) == expected
+
+
+def test_assert_current_date():
+    """Test that date assertions handle live date and datetime values."""
+    assert expect(datetime.date.today(), v.Date)
+    assert expect(datetime.datetime.now(), v.Date)
 
-    assert opts['msg'] in str(exc.value)
+    with pytest.raises(AssertionError):
+        v.NotDate(datetime.datetime.now())
 
 
 @pytest.mark.parametrize('obj,alias',
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# pylint: skip-file
+"""Python 2/3 compatibility
+"""
+
+from decimal import Decimal
+import sys
+
+
+PY2 = sys.version_info[0] == 2
+
+
+if PY2:
+    from itertools import imap
+
+    string_types = (basestring,)
+    integer_types = (int, long)
+else:
+    imap = map
+
+    string_types = (str,)
+    integer_types = (int,)
+
+
+number_types = integer_types + (float, Decimal)
@@ -26,6 +26,8 @@ class Assertion(object):
         msg (str, optional): Override assert message to use when performing
             assertion.
     """
+    __slots__ = ()
+
     #: Default format string used for assert message.
     reason = ''
 
@@ -48,12 +50,19 @@ class Assertion(object):
         """Return formatted assert message. This is used to generate the assert
         message during :meth:`__call__`. If no ``msg`` keyword argument is
         provided, then :attr:`reason` will be used as the format string. By
-        default, passed in ``args`` and ``kargs`` along with the classes
-        ``__dict__`` dictionary are given to the format string. In all cases,
-        ``arg[0]`` will be the `value` that is being validated.
+        default, passed in ``args`` and ``kargs`` along with the instance
+        attributes (from ``__slots__`` and any ``__dict__``) are given to the
+        format string. In all cases, ``arg[0]`` will be the `value` that is
+        being validated.
         """
         reason = kargs.pop('msg', None) or self.reason
-        kargs.update(self.__dict__)
+
+        for cls in reversed(type(self).__mro__):
+            for attr in getattr(cls, '__slots__', ()):
+                if hasattr(self, attr):
+                    kargs[attr] = getattr(self, attr)
+
+        kargs.update(getattr(self, '__dict__', {}))
         return reason.format(*args, **kargs)
 
     def compare(self, value):  # pragma: no cover
@@ -83,23 +92,28 @@ class Assertion(object):
         fmt_kargs = {'msg': opts.pop('msg', None)}
         fmt_kargs.update(opts)
 
-        assert self.compare(*args, **opts), self.format_msg(*args, **fmt_kargs)
+        if not self.compare(*args, **opts):
+            raise AssertionError(self.format_msg(*args, **fmt_kargs))
+
         return True
 
 
 class Comparator(Assertion):
     """Base class for assertions that compare two values."""
-    def __init__(self, comparable, value=NotSet, **opts):
-        if value is not NotSet:
-            # Swap variables since the prescence of both inputs indicates we
-            # are immediately executing validation.
-            value, comparable = comparable, value
+    __slots__ = ('comparable',)
 
+    def __init__(self, comparable, value=NotSet, **opts):
         # Whether we are validating now or later, set comparable on class since
         # self.compare() expects comparable to be an instance variable.
-        self.comparable = comparable
-
-        super(Comparator, self).__init__(value, **opts)
+        if value is NotSet:
+            self.comparable = comparable
+            self.set_options(opts)
+        else:
+            # Swap variables since the prescence of both inputs indicates we
+            # are immediately executing validation.
+            self.comparable = value
+            self.set_options(opts)
+            self(comparable, **opts)
 
     def compare(self, value):
         # pylint: disable=not-callable
@@ -110,6 +124,8 @@ class Negate(object):
     """Mixin class that negates the results of :meth:`compare` from the parent
     class.
     """
+    __slots__ = ()
+
     def compare(self, *args, **opts):
         try:
             return not super(Negate, self).compare(*args, **opts)
@@ -121,8 +137,5 @@ def is_assertion(obj):
     """Return whether `obj` is either an instance or subclass of
     :class:`Assertion`.
     """
-    try:
-        return isinstance(obj, Assertion) or issubclass(obj, Assertion)
-    except TypeError:
-        # Happens if `obj` isn't a class.
-        return False
+    return (isinstance(obj, Assertion) or
+            (isinstance(obj, type) and issubclass(obj, Assertion)))
@@ -36,6 +36,8 @@ class In(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not in {comparable}'
 
@@ -61,6 +63,8 @@ class NotIn(Negate, In):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is in {comparable}'
 
@@ -78,6 +82,8 @@ class Contains(Comparator):
 
     .. versionadded:: 0.2.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} does not contain {comparable}'
 
@@ -103,6 +109,8 @@ class NotContains(Negate, Contains):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} contains {comparable}'
 
@@ -120,12 +128,25 @@ class ContainsOnly(Comparator):
 
     .. versionadded:: 0.2.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} does not only contain values in {comparable}'
 
     @staticmethod
     def op(value, comparable):
         """Return whether `value` contains only values in `comparable`."""
+        # Sets are already hashed, so only sequences are converted to get
+        # constant time membership checks.
+        if isinstance(comparable, (list, tuple)) and hasattr(value, '__len__'):
+            try:
+                members = frozenset(comparable)
+                return all(val in members for val in value)
+            except TypeError:
+                # Fall back to scanning `comparable` when items in `value` or
+                # `comparable` are unhashable.
+                pass
+
         try:
             return all(val in comparable for val in value)
         except (TypeError, ValueError):
@@ -145,6 +166,8 @@ class NotContainsOnly(Negate, ContainsOnly):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} contains only {comparable}'
 
@@ -163,9 +186,14 @@ class Subset(Comparator):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a subset of {comparable}'
-    op = pydash.rearg(pydash.is_match, 1, 0)
+
+    @staticmethod
+    def op(value, comparable):
+        return pydash.is_match(comparable, value)
 
 
 to_be_subset = Subset
@@ -181,6 +209,8 @@ class NotSubset(Negate, Subset):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a subset of {comparable}'
 
@@ -199,6 +229,8 @@ class Superset(Comparator):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a supserset of {comparable}'
     op = staticmethod(pydash.is_match)
@@ -217,6 +249,8 @@ class NotSuperset(Negate, Superset):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a superset of {comparable}'
 
@@ -235,6 +269,8 @@ class Unique(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} contains duplicate items'
 
@@ -243,16 +279,30 @@ class Unique(Assertion):
         if isinstance(value, dict):
             value = value.values()
 
-        is_unique = True
-        seen = []
+        if isinstance(value, (list, tuple)):
+            try:
+                return len(set(value)) == len(value)
+            except TypeError:
+                # Fall back to comparing items one by one when some of them
+                # are unhashable.
+                pass
+
+        seen = set()
+        unhashable = []
 
         for item in value:
-            if item in seen:
-                is_unique = False
-                break
-            seen.append(item)
+            try:
+                if item in seen or item in unhashable:
+                    return False
+                seen.add(item)
+            except TypeError:
+                # Unhashable items can only be compared by equality against
+                # everything seen so far.
+                if item in unhashable or any(item == other for other in seen):
+                    return False
+                unhashable.append(item)
 
-        return is_unique
+        return True
 
 
 to_be_unique = Unique
@@ -268,6 +318,8 @@ class NotUnique(Negate, Unique):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is unique'
 
@@ -322,6 +374,8 @@ class Length(Between):
         Removed positional tuple argument and only support ``min`` and ``max``
         keyword arguments.
     """
+    __slots__ = ()
+
     #:
     reason = '{0} does not have length between {min} and {max}'
 
@@ -347,6 +401,8 @@ class NotLength(Negate, Length):
 
     .. versionadded:: 1.0.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} has length between {min} and {max}'
 
@@ -2,11 +2,9 @@
 """
 
 import operator
-from functools import partial
 import re
 
-import pydash
-
+from ._compat import string_types
 from .base import Assertion, Comparator, Negate, NotSet
 
 
@@ -35,6 +33,8 @@ class Equal(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not equal to {comparable}'
     op = operator.eq
@@ -53,6 +53,8 @@ class NotEqual(Negate, Equal):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is equal to {comparable}'
 
@@ -79,18 +81,30 @@ class Match(Comparator):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ('flags', 'pattern')
+
     #:
     reason = '{0} does not match the regular expression {comparable}'
 
     def set_options(self, opts):
         self.flags = opts.pop('flags', 0)
 
+        # Compile string patterns once so that repeated calls only perform the
+        # match.
+        if isinstance(self.comparable, string_types):
+            self.pattern = re.compile(self.comparable, self.flags)
+        else:
+            self.pattern = self.comparable
+
     def compare(self, value):
-        return self.op(value, self.comparable, flags=self.flags)
+        try:
+            return bool(self.pattern.match(value))
+        except (TypeError, ValueError):
+            return False
 
     @staticmethod
     def op(value, comparable, flags=0):
-        if pydash.is_string(comparable):
+        if isinstance(comparable, string_types):
             pattern = re.compile(comparable, flags)
         else:
             pattern = comparable
@@ -118,6 +132,8 @@ class NotMatch(Negate, Match):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} matches the regular expression {comparable}'
 
@@ -136,6 +152,8 @@ class Is(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not {comparable}'
     op = operator.is_
@@ -154,6 +172,8 @@ class IsNot(Negate, Is):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is {comparable}'
 
@@ -171,9 +191,14 @@ class IsTrue(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not True'
-    op = partial(operator.is_, True)
+
+    @staticmethod
+    def op(value):
+        return value is True
 
 
 to_be_true = IsTrue
@@ -189,6 +214,8 @@ class IsNotTrue(Negate, IsTrue):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is True'
 
@@ -206,9 +233,14 @@ class IsFalse(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not False'
-    op = partial(operator.is_, False)
+
+    @staticmethod
+    def op(value):
+        return value is False
 
 
 to_be_false = IsFalse
@@ -224,6 +256,8 @@ class IsNotFalse(Negate, IsFalse):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is False'
 
@@ -241,9 +275,14 @@ class IsNone(Assertion):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not None'
-    op = staticmethod(pydash.is_none)
+
+    @staticmethod
+    def op(value):
+        return value is None
 
 
 to_be_none = IsNone
@@ -259,6 +298,8 @@ class IsNotNone(Negate, IsNone):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is None'
 
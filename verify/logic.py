@@ -1,7 +1,7 @@
 """Assertions related to logical operations.
 """
 
-import pydash
+import operator
 
 from .base import Assertion, Comparator, Negate
 
@@ -27,6 +27,8 @@ class Truthy(Assertion):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not truthy'
     op = bool
@@ -45,9 +47,11 @@ class Falsy(Assertion):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not falsy'
-    op = pydash.negate(bool)
+    op = operator.not_
 
 
 to_be_falsy = Falsy
@@ -76,12 +80,18 @@ class Not(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = ('The negation of {comparable} should not be true '
               'when evaluated with {0}')
 
     def compare(self, *args, **opts):
         try:
+            if isinstance(self.comparable, Assertion):
+                # Evaluate assertion instances directly so that a failing
+                # assertion doesn't have to format and raise its message.
+                return not self.comparable.compare(*args, **opts)
             return not self.comparable(*args, **opts)
         except AssertionError:
             return True
@@ -108,6 +118,8 @@ class Predicate(Comparator):
         Catch ``AssertionError`` thrown by `comparable` and return ``False``
         as comparison value instead.
     """
+    __slots__ = ()
+
     #:
     reason = 'The evaluation of {0} using {comparable} is false'
 
@@ -144,15 +156,24 @@ class All(Comparator):
 
     .. versionadded:: 0.2.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not true for all {comparable}'
 
     @staticmethod
     def op(value, comparable):
         """Return whether all results from evaluating `value` in `comparable`
-        predicates return truthy.
+        predicates return truthy. A predicate that raises an ``AssertionError``
+        is treated as returning falsy.
         """
-        return all(pydash.juxtapose(*comparable)(value))
+        for predicate in comparable:
+            try:
+                if not predicate(value):
+                    return False
+            except AssertionError:
+                return False
+        return True
 
 all_ = All
 does_all = All
@@ -170,6 +191,8 @@ class NotAll(Negate, All):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is true for all {comparable}'
 
@@ -190,15 +213,24 @@ class Any(Comparator):
 
     .. versionadded:: 0.2.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not true for any {comparable}'
 
     @staticmethod
     def op(value, comparable):
         """Return whether any results from evaluating `value` in `comparable`
-        predicates return truthy.
+        predicates return truthy. A predicate that raises an ``AssertionError``
+        is treated as returning falsy.
         """
-        return any(pydash.juxtapose(*comparable)(value))
+        for predicate in comparable:
+            try:
+                if predicate(value):
+                    return True
+            except AssertionError:
+                pass
+        return False
 
 
 any_ = Any
@@ -217,6 +249,8 @@ class NotAny(Negate, Any):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is true for some {comparable}'
 
@@ -1,10 +1,12 @@
 """Assertions related to numbers.
 """
 
+from itertools import islice
 import operator
 
 import pydash
 
+from ._compat import imap
 from .base import Assertion, Comparator, Negate, NotSet
 
 
@@ -31,6 +33,19 @@ __all__ = (
 )
 
 
+def _is_monotone(value, op):
+    """Return whether all adjacent pairs of items in `value` satisfy `op`.
+    Mirrors ``pydash.is_monotone`` where a `value` that isn't a ``list`` is
+    treated as a single item and is therefore monotone.
+    """
+    if not isinstance(value, list):
+        return True
+
+    # Map the operator over the adjacent pairs so the loop runs in C instead
+    # of a Python generator.
+    return all(imap(op, value, islice(value, 1, None)))
+
+
 class Greater(Comparator):
     """Asserts that `value` is greater than `comparable`.
 
@@ -43,6 +58,8 @@ class Greater(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not greater than {comparable}'
     op = operator.gt
@@ -67,6 +84,8 @@ class GreaterEqual(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not greater than or equal to {comparable}'
     op = operator.ge
@@ -91,6 +110,8 @@ class Less(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not less than {comparable}'
     op = operator.lt
@@ -115,6 +136,8 @@ class LessEqual(Comparator):
 
     .. versionadded:: 0.0.1
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not less than or equal to {comparable}'
     op = operator.le
@@ -169,6 +192,8 @@ class Between(Assertion):
         Removed positional tuple argument and only support ``min`` and ``max``
         keyword arguments.
     """
+    __slots__ = ('min', 'max')
+
     #:
     reason = '{0} is not between {min} and {max}'
 
@@ -181,9 +206,9 @@ class Between(Assertion):
 
     @staticmethod
     def op(value, min=None, max=None):
-        ge_min = value >= min if min is not None else True
-        le_max = value <= max if max is not None else True
-        return ge_min and le_max
+        if min is not None and not value >= min:
+            return False
+        return max is None or value <= max
 
 
 to_be_between = Between
@@ -199,6 +224,8 @@ class NotBetween(Negate, Between):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is between {min} and {max}'
 
@@ -216,9 +243,14 @@ class Positive(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a positive number'
-    op = staticmethod(pydash.is_positive)
+
+    @staticmethod
+    def op(value):
+        return pydash.is_number(value) and value > 0
 
 
 to_be_positive = Positive
@@ -234,9 +266,14 @@ class Negative(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a negative number'
-    op = staticmethod(pydash.is_negative)
+
+    @staticmethod
+    def op(value):
+        return pydash.is_number(value) and value < 0
 
 
 to_be_negative = Negative
@@ -252,9 +289,17 @@ class Even(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not an even number'
-    op = staticmethod(pydash.is_even)
+
+    @staticmethod
+    def op(value):
+        if type(value) is int:
+            # Test the low bit directly for the common plain integer case.
+            return not value & 1
+        return pydash.is_number(value) and value % 2 == 0
 
 
 to_be_even = Even
@@ -270,9 +315,16 @@ class Odd(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not an odd number'
-    op = staticmethod(pydash.is_odd)
+
+    @staticmethod
+    def op(value):
+        if type(value) is int:
+            return bool(value & 1)
+        return pydash.is_number(value) and value % 2 != 0
 
 
 to_be_odd = Odd
@@ -288,9 +340,11 @@ class Monotone(Comparator):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not monotonic as evaluated by {comparable}'
-    op = staticmethod(pydash.is_monotone)
+    op = staticmethod(_is_monotone)
 
 
 to_be_monotone = Monotone
@@ -306,9 +360,14 @@ class Increasing(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not monotonically increasing'
-    op = staticmethod(pydash.is_increasing)
+
+    @staticmethod
+    def op(value):
+        return _is_monotone(value, operator.le)
 
 
 to_be_increasing = Increasing
@@ -324,9 +383,14 @@ class StrictlyIncreasing(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not strictly increasing'
-    op = staticmethod(pydash.is_strictly_increasing)
+
+    @staticmethod
+    def op(value):
+        return _is_monotone(value, operator.lt)
 
 
 to_be_strictly_increasing = StrictlyIncreasing
@@ -342,9 +406,14 @@ class Decreasing(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not monotonically decreasing'
-    op = staticmethod(pydash.is_decreasing)
+
+    @staticmethod
+    def op(value):
+        return _is_monotone(value, operator.ge)
 
 
 to_be_decreasing = Decreasing
@@ -360,9 +429,14 @@ class StrictlyDecreasing(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not strictly decreasing'
-    op = staticmethod(pydash.is_strictly_decreasing)
+
+    @staticmethod
+    def op(value):
+        return _is_monotone(value, operator.gt)
 
 
 to_be_strictly_decreasing = StrictlyDecreasing
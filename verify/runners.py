@@ -77,6 +77,11 @@ class expect(object):
           :class:`.Predicate` for consistent behavior from external assertion
           functions.
     """
+    __slots__ = ('value',)
+
+    #: Assertions resolved by :meth:`__getattr__`, keyed by attribute name.
+    _assertions = {}
+
     def __init__(self, value, *assertions):
         self.value = value
 
@@ -93,24 +98,25 @@ class expect(object):
         """Invoke assertions via attribute access. All :mod:`verify` assertions
         are available.
         """
-        assertion = getattr(verify, attr, None)
-
-        if not callable(assertion) and not attr.endswith('_'):
-            # Alias method names not ending in underscore to their underscore
-            # counterpart. This allows chaining of functions that have a name
-            # conflict with builtins (e.g. "any_", "all_", etc).
-            assertion = getattr(verify, attr + '_', None)
+        try:
+            assertion = self._assertions[attr]
+        except KeyError:
+            assertion = getattr(verify, attr, None)
+
+            if not callable(assertion) and not attr.endswith('_'):
+                # Alias method names not ending in underscore to their
+                # underscore counterpart. This allows chaining of functions
+                # that have a name conflict with builtins (e.g. "any_",
+                # "all_", etc).
+                assertion = getattr(verify, attr + '_', None)
 
-        if not is_assertion(assertion):
-            raise AttributeError(('"{0}" is not a valid assertion method'
-                                  .format(attr)))
+            if not is_assertion(assertion):
+                raise AttributeError(('"{0}" is not a valid assertion method'
+                                      .format(attr)))
 
-        def chained_assertion(*args, **kargs):
-            assertion(*args, **kargs)(self.value)
-            return self
-        chained_assertion.assertion = assertion
+            self._assertions[attr] = assertion
 
-        return chained_assertion
+        return _ChainedAssertion(self, assertion)
 
     def __call__(self, *assertions):
         for assertion in assertions:
@@ -122,4 +128,20 @@ class expect(object):
         return self
 
 
+class _ChainedAssertion(object):
+    """Bound assertion returned by :meth:`expect.__getattr__` which, when
+    called, evaluates `assertion` against the ``expect`` value and returns the
+    ``expect`` instance for further chaining.
+    """
+    __slots__ = ('expect', 'assertion')
+
+    def __init__(self, expect, assertion):
+        self.expect = expect
+        self.assertion = assertion
+
+    def __call__(self, *args, **kargs):
+        self.assertion(*args, **kargs)(self.expect.value)
+        return self.expect
+
+
 ensure = expect
@@ -3,8 +3,7 @@
 
 import datetime
 
-import pydash
-
+from ._compat import integer_types, number_types, string_types
 from .base import Assertion, Comparator, Negate
 
 
@@ -46,6 +45,8 @@ class Type(Comparator):
     .. versionchanged:: 0.6.0
         Renamed from ``InstanceOf`` to ``Type``
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not an instance of {comparable}'
     op = isinstance
@@ -67,6 +68,8 @@ class NotType(Negate, Type):
     .. versionchanged:: 0.6.0
         Renamed from ``NotInstanceOf`` to ``NotType``
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is an instance of {comparable}'
 
@@ -84,9 +87,14 @@ class Boolean(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a boolean'
-    op = staticmethod(pydash.is_boolean)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, bool)
 
 
 to_be_boolean = Boolean
@@ -102,6 +110,8 @@ class NotBoolean(Negate, Boolean):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a boolean'
 
@@ -119,9 +129,14 @@ class String(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a string'
-    op = staticmethod(pydash.is_string)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, string_types)
 
 
 to_be_string = String
@@ -137,6 +152,8 @@ class NotString(Negate, String):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a string'
 
@@ -154,9 +171,14 @@ class Dict(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a dictionary'
-    op = staticmethod(pydash.is_dict)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, dict)
 
 
 to_be_dict = Dict
@@ -172,6 +194,8 @@ class NotDict(Negate, Dict):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a dict'
 
@@ -189,9 +213,14 @@ class List(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a list'
-    op = staticmethod(pydash.is_list)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, list)
 
 
 to_be_list = List
@@ -207,6 +236,8 @@ class NotList(Negate, List):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a list'
 
@@ -224,9 +255,14 @@ class Tuple(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a tuple'
-    op = staticmethod(pydash.is_tuple)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, tuple)
 
 
 to_be_tuple = Tuple
@@ -242,6 +278,8 @@ class NotTuple(Negate, Tuple):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a tuple'
 
@@ -260,9 +298,14 @@ class Date(Assertion):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a date or datetime object'
-    op = staticmethod(pydash.is_date)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, datetime.date)
 
 
 to_be_date = Date
@@ -278,6 +321,8 @@ class NotDate(Negate, Date):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a date or datetime object'
 
@@ -295,6 +340,8 @@ class DateString(Comparator):
 
     .. versionadded:: 0.3.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} does not match the datetime format {comparable}'
 
@@ -320,6 +367,8 @@ class NotDateString(Negate, DateString):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} matches the datetime format {comparable}'
 
@@ -337,9 +386,14 @@ class Int(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not an integer'
-    op = staticmethod(pydash.is_integer)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, integer_types) and not isinstance(value, bool)
 
 
 to_be_int = Int
@@ -355,6 +409,8 @@ class NotInt(Negate, Int):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is an integer'
 
@@ -372,9 +428,14 @@ class Float(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a float'
-    op = staticmethod(pydash.is_float)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, float)
 
 
 to_be_float = Float
@@ -390,6 +451,8 @@ class NotFloat(Negate, Float):
 
     .. versionadded:: 0.5.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a float'
 
@@ -414,9 +477,14 @@ class Number(Assertion):
 
     .. versionadded:: 0.1.0
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is not a number'
-    op = staticmethod(pydash.is_number)
+
+    @staticmethod
+    def op(value):
+        return isinstance(value, number_types) and not isinstance(value, bool)
 
 
 to_be_number = Number
@@ -435,6 +503,8 @@ class NotNumber(Negate, Number):
     .. versionchanged:: 0.5.0
         Renamed from ``NaN`` to ``NotNumber``.
     """
+    __slots__ = ()
+
     #:
     reason = '{0} is a number'
 